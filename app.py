@@ -1,9 +1,22 @@
 
 import streamlit as st
 import io
+import math
 from PIL import Image
 import os
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+# In lossless mode libwebp treats quality as compression effort, not fidelity,
+# so lossless encodes always use this fixed effort instead of the searched quality
+LOSSLESS_OPTIONS = {
+    'lossless': True,
+    'quality': 75,
+    'method': 4
+}
+
+# The quality search stops early once an encode lands within this fraction of the target size
+SEARCH_TOLERANCE = 0.9
 
 def get_streamlit_version():
     """Get Streamlit version to handle compatibility"""
@@ -15,12 +28,17 @@ def get_streamlit_version():
     except:
         return 1, 0  # Default to old version if can't determine
 
+# use_container_width was introduced in 1.14.0; the version can't change while the app runs
+STREAMLIT_MAJOR, STREAMLIT_MINOR = get_streamlit_version()
+USE_CONTAINER_WIDTH = STREAMLIT_MAJOR > 1 or (STREAMLIT_MAJOR == 1 and STREAMLIT_MINOR >= 14)
+
+# st.cache_data replaced st.experimental_memo in Streamlit 1.18.0
+cache_data = getattr(st, 'cache_data', None) or st.experimental_memo
+
 def display_image(image, caption, **kwargs):
     """Display image with version compatibility"""
     try:
-        major, minor = get_streamlit_version()
-        # use_container_width was introduced in 1.14.0
-        if major > 1 or (major == 1 and minor >= 14):
+        if USE_CONTAINER_WIDTH:
             st.image(image, caption=caption, use_container_width=True)
         else:
             # Use the old parameter name for older versions
@@ -33,6 +51,30 @@ def get_image_size(image_bytes):
     """Get the size of image in KB"""
     return len(image_bytes) / 1024
 
+def encode_webp(image, quality, lossless=False, method=4, img_buffer=None):
+    """
+    Encode image to WebP and return the bytes, reusing img_buffer if given
+
+    quality and method only apply to lossy encodes; lossless encodes always use LOSSLESS_OPTIONS.
+    """
+    if img_buffer is None:
+        img_buffer = BytesIO()
+    else:
+        img_buffer.seek(0)
+        img_buffer.truncate()
+
+    if lossless:
+        save_options = {'format': 'WebP', **LOSSLESS_OPTIONS}
+    else:
+        save_options = {
+            'format': 'WebP',
+            'quality': quality,
+            'method': method
+        }
+
+    image.save(img_buffer, **save_options)
+    return img_buffer.getvalue()
+
 def prepare_image_for_webp(image, preserve_transparency=True):
     """
     Prepare image for WebP conversion while handling transparency properly
@@ -53,7 +95,7 @@ def prepare_image_for_webp(image, preserve_transparency=True):
         else:
             # Composite onto white background
             background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
+            background.paste(image, mask=image)  # An RGBA mask uses its alpha band in place
             return background
 
     elif original_mode == "P":
@@ -67,7 +109,7 @@ def prepare_image_for_webp(image, preserve_transparency=True):
                 # Convert to RGB with white background
                 image = image.convert('RGBA')
                 background = Image.new('RGB', image.size, (255, 255, 255))
-                background.paste(image, mask=image.split()[-1])
+                background.paste(image, mask=image)
                 return background
         else:
             # No transparency, convert to RGB
@@ -88,114 +130,183 @@ def prepare_image_for_webp(image, preserve_transparency=True):
             return image.convert('RGB')
         return image
 
-def compress_image(image, target_size_kb=500, quality=85, max_width=1920, max_height=1080, preserve_transparency=True):
+def predict_quality(point_a, point_b, target_bytes):
+    """
+    Predict the quality that encodes to target_bytes from two (quality, size) encodes
+
+    WebP size is roughly log-linear in quality, so the points are interpolated in log space.
+    Returns None when the points don't define an increasing curve.
+    """
+    (quality_a, size_a), (quality_b, size_b) = point_a, point_b
+    if quality_a == quality_b:
+        return None
+
+    slope = (math.log(size_b) - math.log(size_a)) / (quality_b - quality_a)
+    if slope <= 0:
+        return None
+
+    return quality_a + (math.log(target_bytes) - math.log(size_a)) / slope
+
+def resize_to_fit(image, max_width, max_height):
+    """
+    Downscale image to fit within max dimensions, keeping the aspect ratio
+
+    Returns the image unchanged when it already fits.
+    """
+    width, height = image.size
+    resize_ratio = min(max_width / width, max_height / height, 1.0)
+
+    if resize_ratio < 1.0:
+        new_width = int(width * resize_ratio)
+        new_height = int(height * resize_ratio)
+
+        # Use LANCZOS for better quality with transparency; reducing_gap lets Pillow box-reduce
+        # large downscales first so LANCZOS only resolves the last 2x or so.
+        # Not thumbnail(): it resizes in place, and the unresized image may still feed the mobile version
+        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+    return image
+
+def compress_image(image, target_size_kb=500, quality=85, preserve_transparency=True, has_transparency=False,
+                   original_size_kb=None):
     """
     Compress image to target size and convert to WebP format
 
     Args:
-        image: PIL Image object
+        image: PIL Image object prepared for WebP and already resized with resize_to_fit
         target_size_kb: Target file size in KB
         quality: Initial quality (0-100)
-        max_width: Maximum width for desktop
-        max_height: Maximum height for desktop
         preserve_transparency: Whether to preserve transparency
+        has_transparency: Whether the original image has transparency
+        original_size_kb: Size of the uploaded file in KB when it needed no resizing,
+            enables the fast path for already small images
 
     Returns:
-        tuple: (compressed_image_bytes, final_quality, final_dimensions, has_transparency)
+        tuple: (compressed_image_bytes, final_quality, final_dimensions, final_image)
+        where final_image is the image that was encoded, for previews
     """
 
-    # Check if original image has transparency
-    has_transparency = image.mode in ("RGBA", "LA") or (image.mode == "P" and 'transparency' in image.info)
+    # Already small enough: a single fast encode is all that's needed
+    if original_size_kb is not None and original_size_kb <= target_size_kb:
+        lossless = has_transparency and preserve_transparency and quality > 90
+        # method 0 is libwebp's fastest preset; it only affects the lossy case
+        img_bytes = encode_webp(image, quality, lossless=lossless, method=0)
+        if get_image_size(img_bytes) <= target_size_kb:
+            return img_bytes, quality, image.size, image
 
-    # Prepare image for WebP conversion
-    image = prepare_image_for_webp(image, preserve_transparency and has_transparency)
+    prepared_image = image
 
-    # Calculate resize ratio to fit within max dimensions
-    width, height = image.size
-    resize_ratio = min(max_width / width, max_height / height, 1.0)
+    lossless_allowed = has_transparency and preserve_transparency
+    target_bytes = target_size_kb * 1024
+    best_quality = quality
+    best_image_bytes = None
 
-    if resize_ratio < 1.0:
-        new_width = int(width * resize_ratio)
-        new_height = int(height * resize_ratio)
-        # Use LANCZOS for better quality with transparency
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # Shared by every encode below; getvalue() returns a copy so reuse is safe
+    img_buffer = BytesIO()
 
-    # Binary search for optimal quality
-    low_quality = 1
+    # Lossless is only used above q90, so try it on its own instead of mixing it into the size model
     high_quality = quality
-    best_quality = quality
-    best_image_bytes = None
+    if lossless_allowed and quality > 90:
+        img_bytes = encode_webp(image, quality, lossless=True, img_buffer=img_buffer)
+        if len(img_bytes) <= target_bytes:
+            best_image_bytes = img_bytes
+        high_quality = 90
+
+    if best_image_bytes is None:
+        # Search encodes use libwebp's default method 4, the same as the output, so the sizes they
+        # measure are the sizes returned and the best fitting encode needs no re-encode.
+        # Probe the top of the range, then 40 points lower, then interpolate between the
+        # closest encodes under and over the target until they are adjacent or one is close enough
+        low_quality = min(max(quality - 40, 20), high_quality - 1)
+        tried = []
+        candidate = high_quality
+
+        while candidate is not None:
+            img_bytes = encode_webp(image, candidate, img_buffer=img_buffer)
+            tried.append((candidate, len(img_bytes)))
+
+            if len(img_bytes) <= target_bytes and (best_image_bytes is None or candidate > best_quality):
+                best_quality = candidate
+                best_image_bytes = img_bytes
 
-    while low_quality <= high_quality:
-        current_quality = (low_quality + high_quality) // 2
+            under = max((point for point in tried if point[1] <= target_bytes), default=None)
+            over = min((point for point in tried if point[1] > target_bytes), default=None)
 
-        # Save image with current quality
-        img_buffer = BytesIO()
+            if under is not None and under[1] >= target_bytes * SEARCH_TOLERANCE:
+                break
 
-        # Save with appropriate options for transparency
-        save_options = {
-            'format': 'WebP',
-            'quality': current_quality,
-            'optimize': True
-        }
+            if len(tried) == 1:
+                candidate = low_quality if under is None and low_quality >= 1 else None
+                continue
 
-        # Add lossless option for very high quality with transparency
-        if has_transparency and preserve_transparency and current_quality > 90:
-            save_options['lossless'] = True
-            save_options.pop('quality')  # lossless mode doesn't use quality
+            if under is None:
+                # Everything so far is over target: extrapolate down from the two lowest encodes
+                point_a, point_b = sorted(tried)[:2]
+                lowest, highest = 1, over[0] - 1
+            else:
+                point_a, point_b = under, over
+                lowest, highest = under[0] + 1, over[0] - 1
 
-        image.save(img_buffer, **save_options)
-        img_bytes = img_buffer.getvalue()
-        img_size_kb = len(img_bytes) / 1024
+            if highest < lowest:
+                break
 
-        if img_size_kb <= target_size_kb:
-            best_quality = current_quality
-            best_image_bytes = img_bytes
-            low_quality = current_quality + 1
-        else:
-            high_quality = current_quality - 1
+            # The curve bends near low qualities, so interpolation can keep landing on the same
+            # side of the target; bisect the bracket whenever the last two encodes did
+            same_side = (tried[-1][1] <= target_bytes) == (tried[-2][1] <= target_bytes)
+            predicted = predict_quality(point_a, point_b, target_bytes)
+            if predicted is None or (under is not None and same_side):
+                candidate = (lowest + highest) // 2
+            else:
+                candidate = min(max(int(round(predicted)), lowest), highest)
 
-    # If we couldn't achieve target size, try further resizing
-    if best_image_bytes is None or get_image_size(best_image_bytes) > target_size_kb:
-        # Reduce dimensions further
-        current_width, current_height = image.size
-        reduction_factor = 0.8
+        # Only fall back to resizing once the lowest quality has been ruled out at the output method
+        if best_image_bytes is None and all(point[0] != 1 for point in tried):
+            img_bytes = encode_webp(image, 1, img_buffer=img_buffer)
+            if len(img_bytes) <= target_bytes:
+                best_quality = 1
+                best_image_bytes = img_bytes
 
-        while get_image_size(best_image_bytes or img_bytes) > target_size_kb and reduction_factor > 0.3:
-            new_width = int(current_width * reduction_factor)
-            new_height = int(current_height * reduction_factor)
-            resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    # If we couldn't achieve target size, shrink the pixel count in proportion to the overshoot
+    if best_image_bytes is None:
+        current_width, current_height = image.size
 
-            img_buffer = BytesIO()
+        # Measure the overshoot with the same lossy settings the resized encodes use
+        reference_size = len(encode_webp(image, best_quality, img_buffer=img_buffer))
+        scale = math.sqrt(target_bytes / reference_size) * 0.95
 
-            # Use the same save options as before
-            save_options = {
-                'format': 'WebP',
-                'quality': best_quality,
-                'optimize': True
-            }
+        for _ in range(2):
+            new_width = max(int(current_width * scale), 1)
+            new_height = max(int(current_height * scale), 1)
+            image = prepared_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-            resized_image.save(img_buffer, **save_options)
-            img_bytes = img_buffer.getvalue()
+            img_bytes = encode_webp(image, best_quality, img_buffer=img_buffer)
 
-            if len(img_bytes) / 1024 <= target_size_kb:
+            if get_image_size(img_bytes) <= target_size_kb:
                 best_image_bytes = img_bytes
-                image = resized_image
                 break
 
-            reduction_factor -= 0.1
+            # Size rarely falls in proportion to pixel count (alpha and edges compress differently),
+            # so fit size ~ scale ** k through both measurements for the next attempt
+            exponent = math.log(len(img_bytes) / reference_size) / math.log(scale) if scale < 1.0 else 0
+            if exponent > 0:
+                scale *= (target_bytes / len(img_bytes)) ** (1 / exponent) * 0.95
+            else:
+                scale *= 0.9
 
     final_dimensions = image.size
-    return best_image_bytes or img_bytes, best_quality, final_dimensions, has_transparency
+    return best_image_bytes or img_bytes, best_quality, final_dimensions, image
 
-def create_mobile_version(image, max_width=768, preserve_transparency=True):
-    """Create mobile-friendly version of image"""
-    # Check if original image has transparency
-    has_transparency = image.mode in ("RGBA", "LA") or (image.mode == "P" and 'transparency' in image.info)
+def create_mobile_version(image, max_width=768):
+    """
+    Create mobile-friendly version of an image already prepared for WebP
 
-    # Prepare image for WebP conversion
-    image = prepare_image_for_webp(image, preserve_transparency and has_transparency)
+    Args:
+        image: PIL Image object returned by prepare_image_for_webp (RGB or RGBA)
+        max_width: Maximum width for mobile
 
+    Returns:
+        tuple: (compressed_image_bytes, final_dimensions, final_image)
+    """
     width, height = image.size
     if width > max_width:
         ratio = max_width / width
@@ -207,12 +318,88 @@ def create_mobile_version(image, max_width=768, preserve_transparency=True):
     # Save with appropriate options for transparency
     save_options = {
         'format': 'WebP',
-        'quality': 80,
-        'optimize': True
+        'quality': 80
     }
 
     image.save(img_buffer, **save_options)
-    return img_buffer.getvalue(), image.size, has_transparency
+    return img_buffer.getvalue(), image.size, image
+
+@cache_data(show_spinner=False, max_entries=4)
+def decode_image(uploaded_file, desktop_width, desktop_height, mobile_width):
+    """
+    Decode an uploaded file, cached across Streamlit reruns
+
+    Args:
+        uploaded_file: Streamlit UploadedFile, decoded directly without copying its bytes
+        desktop_width: Maximum width for desktop
+        desktop_height: Maximum height for desktop
+        mobile_width: Maximum width for mobile
+
+    Returns:
+        tuple: (PIL Image object, original_dimensions)
+    """
+    uploaded_file.seek(0)
+    image = Image.open(uploaded_file)
+    original_size = image.size
+
+    # Let libjpeg downscale by 1/2, 1/4 or 1/8 while decoding, keeping at least the output size.
+    # draft() only reduces while both sides stay above the requested size, so request the
+    # aspect-correct size covering both the fitted desktop width and the mobile width
+    if image.format == 'JPEG':
+        width, height = image.size
+        desktop_ratio = min(desktop_width / width, desktop_height / height, 1.0)
+        draft_width = max(int(width * desktop_ratio), min(mobile_width, width))
+        draft_height = math.ceil(height * draft_width / width)
+        image.draft('RGB', (draft_width, draft_height))
+
+    # Decode now, then rewind so the upload hashes the same for the next cached call
+    image.load()
+    uploaded_file.seek(0)
+    return image, original_size
+
+@cache_data(show_spinner=False, max_entries=4)
+def create_responsive_versions(uploaded_file, target_size_kb, quality, desktop_width, desktop_height,
+                               mobile_width, preserve_transparency, has_transparency):
+    """
+    Create desktop and mobile WebP versions, cached on the upload and settings
+
+    Returns:
+        tuple: (desktop_bytes, desktop_quality, desktop_dimensions, desktop_image,
+                mobile_bytes, mobile_dimensions, mobile_image)
+    """
+    image, _ = decode_image(uploaded_file, desktop_width, desktop_height, mobile_width)
+
+    # Convert and resize for desktop up front so both versions can start encoding together
+    image = prepare_image_for_webp(image, preserve_transparency and has_transparency)
+    desktop_prepared = resize_to_fit(image, desktop_width, desktop_height)
+
+    # The fast path for small uploads only applies when no resizing was needed
+    original_size_kb = uploaded_file.size / 1024 if desktop_prepared.size == image.size else None
+
+    # Derive mobile from the desktop resize unless that ended up narrower than mobile needs
+    if desktop_prepared.width >= min(mobile_width, image.width):
+        mobile_source = desktop_prepared
+    else:
+        mobile_source = image
+
+    # Image.save() stores its options on the image while encoding, so the two workers must never
+    # save the same object. Mobile only gets a new image from resizing when it is wider than mobile_width
+    if mobile_source is desktop_prepared and mobile_source.width <= mobile_width:
+        mobile_source = mobile_source.copy()
+
+    # Run the desktop and mobile encodes on worker threads; Pillow releases the GIL while encoding
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        desktop_future = executor.submit(
+            compress_image,
+            desktop_prepared, target_size_kb, quality, preserve_transparency, has_transparency, original_size_kb
+        )
+        mobile_future = executor.submit(create_mobile_version, mobile_source, mobile_width)
+
+        desktop_compressed, desktop_quality, desktop_dims, desktop_image = desktop_future.result()
+        mobile_compressed, mobile_dims, mobile_image = mobile_future.result()
+
+    return (desktop_compressed, desktop_quality, desktop_dims, desktop_image,
+            mobile_compressed, mobile_dims, mobile_image)
 
 def display_footer():
     """Display footer with creator credit"""
@@ -238,7 +425,10 @@ def main():
     
     # Sidebar for settings
     st.sidebar.header("⚙️ Compression Settings")
-    target_size = st.sidebar.number_input(
+
+    # Group the settings in a form so changes only rerun the app once Apply is clicked
+    settings_form = st.sidebar.form("settings")
+    target_size = settings_form.number_input(
         "Target file size (KB)", 
         min_value=10, 
         max_value=5000, 
@@ -247,7 +437,7 @@ def main():
         help="Maximum file size for the compressed image"
     )
 
-    initial_quality = st.sidebar.slider(
+    initial_quality = settings_form.slider(
         "Initial Quality", 
         min_value=10, 
         max_value=100, 
@@ -256,22 +446,22 @@ def main():
     )
 
     # Transparency handling option
-    st.sidebar.subheader("🎭 Transparency Options")
-    preserve_transparency = st.sidebar.checkbox(
+    settings_form.subheader("🎭 Transparency Options")
+    preserve_transparency = settings_form.checkbox(
         "Preserve Transparency", 
         value=True,
         help="Keep transparent areas transparent (recommended for PNG with transparency)"
     )
 
     if not preserve_transparency:
-        background_color = st.sidebar.color_picker(
+        background_color = settings_form.color_picker(
             "Background Color", 
             value="#FFFFFF",
             help="Color to use for transparent areas when transparency is not preserved"
         )
 
-    st.sidebar.subheader("📱 Responsive Sizes")
-    desktop_width = st.sidebar.number_input(
+    settings_form.subheader("📱 Responsive Sizes")
+    desktop_width = settings_form.number_input(
         "Desktop max width (px)", 
         min_value=800, 
         max_value=4000, 
@@ -279,7 +469,7 @@ def main():
         step=100
     )
 
-    desktop_height = st.sidebar.number_input(
+    desktop_height = settings_form.number_input(
         "Desktop max height (px)", 
         min_value=600, 
         max_value=3000, 
@@ -287,7 +477,7 @@ def main():
         step=100
     )
 
-    mobile_width = st.sidebar.number_input(
+    mobile_width = settings_form.number_input(
         "Mobile max width (px)", 
         min_value=320, 
         max_value=1024, 
@@ -295,6 +485,8 @@ def main():
         step=50
     )
 
+    settings_form.form_submit_button("✅ Apply Settings")
+
     # File uploader
     uploaded_file = st.file_uploader(
         "Choose an image file",
@@ -305,12 +497,12 @@ def main():
     if uploaded_file is not None:
         try:
             # Display original image info
-            original_bytes = uploaded_file.getvalue()
-            original_size_kb = len(original_bytes) / 1024
+            original_size_kb = uploaded_file.size / 1024
 
             # Open image
-            image = Image.open(uploaded_file)
-            original_width, original_height = image.size
+            image, (original_width, original_height) = decode_image(
+                uploaded_file, desktop_width, desktop_height, mobile_width
+            )
 
             # Check for transparency
             has_transparency = image.mode in ("RGBA", "LA") or (image.mode == "P" and 'transparency' in image.info)
@@ -345,14 +537,10 @@ def main():
             # Compress button
             if st.button("🚀 Compress Image", type="primary"):
                 with st.spinner("Compressing image... This may take a moment."):
-                    # Compress for desktop
-                    desktop_compressed, desktop_quality, desktop_dims, desktop_has_transparency = compress_image(
-                        image.copy(), target_size, initial_quality, desktop_width, desktop_height, preserve_transparency
-                    )
-
-                    # Create mobile version
-                    mobile_compressed, mobile_dims, mobile_has_transparency = create_mobile_version(
-                        image.copy(), mobile_width, preserve_transparency
+                    (desktop_compressed, desktop_quality, desktop_dims, desktop_image,
+                     mobile_compressed, mobile_dims, mobile_image) = create_responsive_versions(
+                        uploaded_file, target_size, initial_quality, desktop_width, desktop_height,
+                        mobile_width, preserve_transparency, has_transparency
                     )
 
                     # Calculate compression stats
@@ -383,7 +571,7 @@ def main():
                     st.metric("Size", f"{desktop_size_kb:.1f} KB", f"-{desktop_reduction:.1f}%")
                     st.metric("Dimensions", f"{desktop_dims[0]} × {desktop_dims[1]}")
                     st.metric("Quality", f"{desktop_quality}%")
-                    desktop_transparency_text = "✅ Preserved" if (desktop_has_transparency and preserve_transparency) else "❌ Removed"
+                    desktop_transparency_text = "✅ Preserved" if (has_transparency and preserve_transparency) else "❌ Removed"
                     st.metric("Transparency", desktop_transparency_text)
 
                 with col3:
@@ -391,17 +579,22 @@ def main():
                     st.metric("Size", f"{mobile_size_kb:.1f} KB", f"-{mobile_reduction:.1f}%")
                     st.metric("Dimensions", f"{mobile_dims[0]} × {mobile_dims[1]}")
                     st.metric("Optimized for", "Mobile devices")
-                    mobile_transparency_text = "✅ Preserved" if (mobile_has_transparency and preserve_transparency) else "❌ Removed"
+                    mobile_transparency_text = "✅ Preserved" if (has_transparency and preserve_transparency) else "❌ Removed"
                     st.metric("Transparency", mobile_transparency_text)
 
-                # Display compressed images using compatibility function
+                # Display the resized images that were encoded, using compatibility function.
+                # They are shown before WebP encoding, so the captions say so
                 st.subheader("🖥️ Desktop Version")
-                desktop_image = Image.open(BytesIO(desktop_compressed))
-                display_image(desktop_image, f"Desktop WebP: {desktop_size_kb:.1f} KB")
+                display_image(
+                    desktop_image,
+                    f"Desktop preview before WebP encoding (compression artifacts not shown) - file: {desktop_size_kb:.1f} KB"
+                )
 
                 st.subheader("📱 Mobile Version")
-                mobile_image = Image.open(BytesIO(mobile_compressed))
-                display_image(mobile_image, f"Mobile WebP: {mobile_size_kb:.1f} KB")
+                display_image(
+                    mobile_image,
+                    f"Mobile preview before WebP encoding (compression artifacts not shown) - file: {mobile_size_kb:.1f} KB"
+                )
 
                 # Download buttons
                 st.subheader("⬇️ Download Compressed Images")
@@ -483,7 +676,7 @@ def main():
         with st.expander("📋 How to use this tool"):
             st.write("""
             1. **Upload an image**: Use the file uploader above to select your image
-            2. **Adjust settings**: Use the sidebar to customize compression settings
+            2. **Adjust settings**: Use the sidebar to customize compression settings, then click Apply Settings
             3. **Transparency options**: Choose whether to preserve or replace transparency
             4. **Compress**: Click the compress button to process your image
             5. **Download**: Get both desktop and mobile optimized versions
@@ -493,7 +686,7 @@ def main():
             - ✅ WebP conversion for better compression
             - ✅ **Transparency preservation** for PNG images
             - ✅ Desktop and mobile responsive versions
-            - ✅ Quality optimization using binary search algorithm
+            - ✅ Quality optimization using size prediction from probe encodes
             - ✅ Support for multiple image formats
             - ✅ Compatible with all Streamlit versions
             """)